@@ -19,9 +19,13 @@ def create_app(config_name='development'):
 
     # Initialize extensions
     db.init_app(app)
-    migrate.init_app(app, db)
     cache.init_app(app)
-    CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ORIGINS']}})
+
+    # Tests build the schema with create_all() and never send cross-origin
+    # requests, so skip migrations and CORS headers there
+    if not app.testing:
+        migrate.init_app(app, db)
+        CORS(app, resources={r"/api/*": {"origins": app.config['CORS_ORIGINS']}})
 
     # Import models for Flask-Migrate
     from app import models  # noqa: F401
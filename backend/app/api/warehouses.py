@@ -1,6 +1,7 @@
 """Warehouse API endpoints."""
 from flask import request
 from flask_restx import Namespace, Resource, fields
+from sqlalchemy.orm import selectinload
 from app.extensions import db
 from app.models import Warehouse, Zone
 
@@ -83,7 +84,7 @@ class WarehouseList(Resource):
     @ns.marshal_list_with(warehouse_model)
     def get(self):
         """List all warehouses."""
-        warehouses = Warehouse.query.all()
+        warehouses = Warehouse.query.options(selectinload(Warehouse.zones)).all()
         return [w.to_dict() for w in warehouses]
 
     @ns.doc('create_warehouse')
@@ -123,7 +124,9 @@ class WarehouseResource(Resource):
     @ns.marshal_with(warehouse_with_zones)
     def get(self, warehouse_id):
         """Get warehouse by ID."""
-        warehouse = Warehouse.query.get_or_404(warehouse_id, description='Warehouse not found')
+        warehouse = Warehouse.query.options(selectinload(Warehouse.zones)).filter_by(
+            id=warehouse_id
+        ).first_or_404(description='Warehouse not found')
         return warehouse.to_dict(include_zones=True)
 
     @ns.doc('update_warehouse')
@@ -166,8 +169,8 @@ class ZoneList(Resource):
     @ns.marshal_list_with(zone_model)
     def get(self, warehouse_id):
         """List all zones for a warehouse."""
-        warehouse = Warehouse.query.get_or_404(warehouse_id, description='Warehouse not found')
-        zones = warehouse.zones.order_by(Zone.zone_order).all()
+        Warehouse.query.get_or_404(warehouse_id, description='Warehouse not found')
+        zones = Zone.query.filter_by(warehouse_id=warehouse_id).order_by(Zone.zone_order).all()
         return [z.to_dict() for z in zones]
 
     @ns.doc('create_zone')
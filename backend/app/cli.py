@@ -37,7 +37,7 @@ def seed_data_command(clear, with_allocation):
         for warehouse in warehouses:
             db.session.add(warehouse)
         db.session.commit()
-        click.echo(f"[OK] Created {len(warehouses)} warehouses with {sum(warehouse.zones.count() for warehouse in warehouses)} zones")
+        click.echo(f"[OK] Created {len(warehouses)} warehouses with {sum(len(warehouse.zones) for warehouse in warehouses)} zones")
 
         # Create inventory uploads
         click.echo("\nCreating inventory uploads...")
@@ -60,7 +60,7 @@ def seed_data_command(clear, with_allocation):
         click.echo("SUMMARY:")
         click.echo(f"  Warehouses: {len(warehouses)}")
         for w in warehouses:
-            click.echo(f"    - {w.name}: {w.zones.count()} zones, {float(w.total_area):,.0f} sq ft")
+            click.echo(f"    - {w.name}: {len(w.zones)} zones, {float(w.total_area):,.0f} sq ft")
         click.echo(f"  Inventory uploads: {len(uploads)}")
         for u in uploads:
             click.echo(f"    - {u.upload_name}: {u.total_items} items, {float(u.total_area):,.0f} sq ft")
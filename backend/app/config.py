@@ -1,6 +1,7 @@
 """Application configuration."""
 import os
 from datetime import timedelta
+from sqlalchemy.pool import StaticPool
 
 
 class Config:
@@ -58,8 +59,17 @@ class TestingConfig(Config):
     """Testing configuration."""
 
     TESTING = True
-    SQLALCHEMY_DATABASE_URI = 'sqlite:///:memory:'
+    # Single shared in-memory connection so every session sees the same database
+    SQLALCHEMY_DATABASE_URI = 'sqlite://'
+    SQLALCHEMY_ENGINE_OPTIONS = {
+        'poolclass': StaticPool,
+        'connect_args': {'check_same_thread': False}
+    }
     WTF_CSRF_ENABLED = False
+    PROPAGATE_EXCEPTIONS = True
+
+    # Cache
+    CACHE_TYPE = 'NullCache'
 
 
 # Configuration dictionary
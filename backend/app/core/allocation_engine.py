@@ -75,72 +75,71 @@ class AllocationEngine:
         # Pre-calculate zone characteristics for performance
         zone_heights = [zone['height'] for zone in zones]
         zone_strengths = [zone.get('strength', float('inf')) for zone in zones]
+        zone_climate = [zone.get('climate_controlled', False) for zone in zones]
+        zone_special = [zone.get('special_handling', False) for zone in zones]
+        zone_specs = list(zip(range(len(zones)), zone_heights, zone_strengths,
+                              zone_climate, zone_special))
+
+        # Remaining area per zone, kept in a flat list during the loop and
+        # written back to the zone allocations afterwards
+        zone_remaining = [zone_alloc['remaining_area'] for zone_alloc in zone_allocations]
+
+        # Zone-wide limits used to explain allocation failures
+        max_zone_height = max(zone_heights)
+        max_zone_strength = max(zone_strengths)
+        has_climate_zones = any(zone_climate)
+        has_special_zones = any(zone_special)
+
+        # Allocated entries per zone keyed by item_id for O(1) lookup
+        zone_entries = [{} for _ in zones]
+
+        area_factor = 1 + self.bsf_factor
 
         # Allocate each individual item
         for item in sorted_items:
             # Calculate required area with BSF
-            required_area = item['area'] * (1 + self.bsf_factor)
+            required_area = item['area'] * area_factor
             equipment_height = item['height']
             equipment_psf = item.get('psf', 0)
             requires_climate = item.get('requires_climate_control', False)
             requires_special = item.get('requires_special_handling', False)
 
-            # Find eligible zones
-            eligible_zones = []
+            # Find the best eligible zone: minimal height waste, then most
+            # available area. Ties keep the earliest zone. The climate/special
+            # match bonus depends only on the item, so every eligible zone
+            # scores the same and it does not take part in the comparison.
+            best_zone_idx = None
+            best_key = None
 
-            for zone_idx, zone_alloc in enumerate(zone_allocations):
-                zone = zones[zone_idx]
+            for zone_idx, zone_height, zone_strength, climate, special in zone_specs:
+                remaining_area = zone_remaining[zone_idx]
 
                 # Check basic constraints
-                if not (equipment_height <= zone_heights[zone_idx] and
-                        required_area <= zone_alloc['remaining_area'] and
-                        equipment_psf <= zone_strengths[zone_idx]):
+                if not (equipment_height <= zone_height and
+                        required_area <= remaining_area and
+                        equipment_psf <= zone_strength):
                     continue
 
                 # Check climate control requirement
-                if requires_climate and not zone.get('climate_controlled', False):
+                if requires_climate and not climate:
                     continue
 
                 # Check special handling requirement
-                if requires_special and not zone.get('special_handling', False):
+                if requires_special and not special:
                     continue
 
-                # Calculate height waste (prefer minimal waste)
-                height_waste = zone_heights[zone_idx] - equipment_height
-
-                # Calculate priority score (higher is better)
-                priority_score = 0
-
-                # Bonus for exact climate match
-                if requires_climate and zone.get('climate_controlled', False):
-                    priority_score += 1000
-
-                # Bonus for exact special handling match
-                if requires_special and zone.get('special_handling', False):
-                    priority_score += 1000
-
-                eligible_zones.append({
-                    'zone_idx': zone_idx,
-                    'priority_score': priority_score,
-                    'height_waste': height_waste,
-                    'area_remaining': zone_alloc['remaining_area']
-                })
-
-            if eligible_zones:
-                # Sort by priority (DESC), minimal height waste, then by available area
-                eligible_zones.sort(key=lambda x: (-x['priority_score'], x['height_waste'], -x['area_remaining']))
+                key = (zone_height - equipment_height, -remaining_area)
+                if best_key is None or key < best_key:
+                    best_key = key
+                    best_zone_idx = zone_idx
 
+            if best_zone_idx is not None:
                 # Allocate to best zone
-                best_zone = eligible_zones[0]
-                zone_idx = best_zone['zone_idx']
+                zone_idx = best_zone_idx
                 zone_alloc = zone_allocations[zone_idx]
 
                 # Find existing entry for this item type
-                existing_entry = None
-                for entry in zone_alloc['allocated_items']:
-                    if entry['item_id'] == item['item_id']:
-                        existing_entry = entry
-                        break
+                existing_entry = zone_entries[zone_idx].get(item['item_id'])
 
                 if existing_entry:
                     # Add to existing entry
@@ -149,7 +148,7 @@ class AllocationEngine:
                     existing_entry['total_weight'] += item['weight']
                 else:
                     # Create new entry
-                    zone_alloc['allocated_items'].append({
+                    entry = {
                         'item_id': item['item_id'],
                         'name': item['name'],
                         'category': item.get('category'),
@@ -163,14 +162,12 @@ class AllocationEngine:
                         'service_branch': item.get('service_branch'),
                         'requires_climate_control': item.get('requires_climate_control', False),
                         'requires_special_handling': item.get('requires_special_handling', False)
-                    })
+                    }
+                    zone_alloc['allocated_items'].append(entry)
+                    zone_entries[zone_idx][item['item_id']] = entry
 
-                # Update zone utilization
-                zone_alloc['remaining_area'] -= required_area
-                zone_alloc['area_utilization'] = (
-                    (zone_alloc['zone_info']['area'] - zone_alloc['remaining_area']) /
-                    zone_alloc['zone_info']['area'] * 100
-                )
+                # Update zone usage (area utilization is derived after the loop)
+                zone_remaining[zone_idx] -= required_area
                 zone_alloc['total_items'] += 1
                 zone_alloc['total_weight'] += item['weight']
 
@@ -187,13 +184,7 @@ class AllocationEngine:
                 )
             else:
                 # Item doesn't fit - determine failure reason
-                max_zone_height = max(zone_heights)
-                max_zone_area = max(za['remaining_area'] for za in zone_allocations)
-                max_zone_strength = max(zone_strengths)
-
-                # Check for climate/special zones availability
-                has_climate_zones = any(zone.get('climate_controlled', False) for zone in zones)
-                has_special_zones = any(zone.get('special_handling', False) for zone in zones)
+                max_zone_area = max(zone_remaining)
 
                 failure_reasons = []
 
@@ -250,6 +241,15 @@ class AllocationEngine:
                     'can_theoretically_fit': can_theoretically_fit
                 })
 
+        # Area utilization from the final remaining area of each used zone
+        for zone_alloc, remaining_area in zip(zone_allocations, zone_remaining):
+            zone_alloc['remaining_area'] = remaining_area
+            if zone_alloc['total_items']:
+                zone_alloc['area_utilization'] = (
+                    (zone_alloc['zone_info']['area'] - zone_alloc['remaining_area']) /
+                    zone_alloc['zone_info']['area'] * 100
+                )
+
         # Calculate summary statistics
         summary = self._calculate_summary(zone_allocations, allocation_failures)
 
@@ -286,22 +286,24 @@ class AllocationEngine:
         for item in items:
             quantity = item.get('quantity', 1)
 
-            for i in range(quantity):
-                individual_item = {
-                    'item_id': item['id'],
-                    'name': item['name'],
-                    'category': item.get('category'),
-                    'weight': item.get('weight', 0),
-                    'area': item.get('area', 0),
-                    'height': item.get('height', 0),
-                    'psf': item.get('psf', 0),
-                    'service_branch': item.get('service_branch'),
-                    'priority_order': item.get('priority_order', 999),
-                    'requires_climate_control': item.get('requires_climate_control', False),
-                    'requires_special_handling': item.get('requires_special_handling', False),
-                    'item_number': i + 1
-                }
-                individual_items.append(individual_item)
+            # Resolve the item's fields once and copy them for each unit
+            template = {
+                'item_id': item['id'],
+                'name': item['name'],
+                'category': item.get('category'),
+                'weight': item.get('weight', 0),
+                'area': item.get('area', 0),
+                'height': item.get('height', 0),
+                'psf': item.get('psf', 0),
+                'service_branch': item.get('service_branch'),
+                'priority_order': item.get('priority_order', 999),
+                'requires_climate_control': item.get('requires_climate_control', False),
+                'requires_special_handling': item.get('requires_special_handling', False)
+            }
+            individual_items.extend(
+                {**template, 'item_number': item_number}
+                for item_number in range(1, quantity + 1)
+            )
 
         return individual_items
 
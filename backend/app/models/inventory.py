@@ -22,7 +22,7 @@ class InventoryUpload(db.Model):
     upload_metadata = db.Column(db.JSON)  # Store additional info
 
     # Relationships
-    items = db.relationship('InventoryItem', back_populates='upload', cascade='all, delete-orphan', lazy='dynamic')
+    items = db.relationship('InventoryItem', back_populates='upload', cascade='all, delete-orphan')
     allocation_results = db.relationship('AllocationResult', back_populates='upload', lazy='dynamic')
 
     def __repr__(self):
@@ -46,13 +46,13 @@ class InventoryUpload(db.Model):
         }
 
         if include_items:
-            data['items'] = [item.to_dict() for item in self.items.all()]
+            data['items'] = [item.to_dict() for item in self.items]
 
         return data
 
     def calculate_totals(self):
         """Calculate totals from items."""
-        items = self.items.all()
+        items = self.items
         self.total_entries = len(items)
         self.total_items = sum(item.quantity for item in items)
         self.total_weight = sum(float(item.weight or 0) * item.quantity for item in items)
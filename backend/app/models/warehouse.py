@@ -19,7 +19,7 @@ class Warehouse(db.Model):
     updated_at = db.Column(db.DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
 
     # Relationships
-    zones = db.relationship('Zone', back_populates='warehouse', cascade='all, delete-orphan', lazy='dynamic')
+    zones = db.relationship('Zone', back_populates='warehouse', cascade='all, delete-orphan')
     allocation_results = db.relationship('AllocationResult', back_populates='warehouse', lazy='dynamic')
 
     def __repr__(self):
@@ -37,19 +37,18 @@ class Warehouse(db.Model):
             'is_custom': self.is_custom,
             'created_at': self.created_at.isoformat() if self.created_at else None,
             'updated_at': self.updated_at.isoformat() if self.updated_at else None,
-            'zone_count': self.zones.count()
+            'zone_count': len(self.zones)
         }
 
         if include_zones:
-            data['zones'] = [zone.to_dict() for zone in self.zones.all()]
+            data['zones'] = [zone.to_dict() for zone in self.zones]
 
         return data
 
     def calculate_totals(self):
         """Calculate total area and volume from zones."""
-        zones = self.zones.all()
-        self.total_area = sum(float(zone.area or 0) for zone in zones)
-        self.total_volume = sum(float(zone.volume or 0) for zone in zones)
+        self.total_area = sum(float(zone.area or 0) for zone in self.zones)
+        self.total_volume = sum(float(zone.volume or 0) for zone in self.zones)
 
 
 class Zone(db.Model):
@@ -42,12 +42,12 @@ class AllocationService:
         if not warehouse:
             raise ValueError(f"Warehouse {warehouse_id} not found")
 
-        zones = warehouse.zones.all()
+        zones = warehouse.zones
         if not zones:
             raise ValueError(f"Warehouse {warehouse_id} has no zones defined")
 
         # Get inventory items
-        items = upload.items.all()
+        items = upload.items
         if not items:
             raise ValueError(f"Inventory upload {upload_id} has no items")
 
@@ -1,11 +1,14 @@
 """Inventory service for managing inventory uploads and items."""
 from typing import List, Dict, Any, Optional
+from uuid import uuid4
 from werkzeug.datastructures import FileStorage
+from werkzeug.utils import secure_filename
 import os
 import io
 import tempfile
 from openpyxl import Workbook
 from openpyxl.styles import Font, PatternFill
+from sqlalchemy.orm import selectinload
 from app.extensions import db
 from app.models import InventoryUpload, InventoryItem
 from app.services.excel_service import ExcelService, ExcelParsingError
@@ -19,7 +22,8 @@ class InventoryService:
                       upload_name: Optional[str] = None,
                       site: Optional[str] = None,
                       site2: Optional[str] = None,
-                      bsf_factor: float = 0.63) -> InventoryUpload:
+                      bsf_factor: float = 0.63,
+                      dest_dir: Optional[str] = None) -> InventoryUpload:
         """Process an inventory file upload.
 
         Args:
@@ -28,6 +32,8 @@ class InventoryService:
             site: Primary site
             site2: Secondary site
             bsf_factor: Space utilization factor (default 0.63)
+            dest_dir: Directory for the temporary copy of the file
+                (default: the system temp directory)
 
         Returns:
             Created InventoryUpload object
@@ -46,9 +52,13 @@ class InventoryService:
         if file_ext not in allowed_extensions:
             raise ValueError(f"Invalid file type. Allowed types: {', '.join(allowed_extensions)}")
 
-        # Save file temporarily (cross-platform)
-        temp_dir = tempfile.gettempdir()
-        temp_path = os.path.join(temp_dir, file.filename)
+        # Save file temporarily (cross-platform). The uuid prefix keeps
+        # concurrent uploads of identically-named files from clobbering each other,
+        # and the validated extension is re-appended because secure_filename()
+        # can strip a non-ASCII name down to its bare extension.
+        temp_dir = dest_dir or tempfile.gettempdir()
+        safe_stem = secure_filename(file.filename.rsplit('.', 1)[0])
+        temp_path = os.path.join(temp_dir, f"{uuid4().hex}_{safe_stem}.{file_ext}")
         file.save(temp_path)
 
         try:
@@ -130,7 +140,9 @@ class InventoryService:
         Returns:
             InventoryUpload object or None
         """
-        return InventoryUpload.query.get(upload_id)
+        return InventoryUpload.query.options(
+            selectinload(InventoryUpload.items)
+        ).filter_by(id=upload_id).first()
 
     @staticmethod
     def get_upload_items(upload_id: int,
@@ -205,40 +217,53 @@ class InventoryService:
             Dictionary of summary statistics
         """
         upload = InventoryUpload.query.get_or_404(upload_id)
-        items = upload.items.all()
 
-        # Category breakdown
+        # Category breakdown (aggregated in SQL so only per-category rows come back)
+        category_rows = db.session.query(
+            InventoryItem.category,
+            db.func.count(InventoryItem.id),
+            db.func.sum(InventoryItem.quantity),
+            db.func.sum(db.func.coalesce(InventoryItem.weight, 0) * InventoryItem.quantity),
+            db.func.sum(db.func.coalesce(InventoryItem.area, 0) * InventoryItem.quantity)
+        ).filter(
+            InventoryItem.upload_id == upload_id
+        ).group_by(InventoryItem.category).all()
+
         category_stats = {}
-        service_branch_stats = {}
+        for category, count, total_quantity, total_weight, total_area in category_rows:
+            stats = category_stats.setdefault(category or 'Uncategorized', {
+                'count': 0,
+                'total_quantity': 0,
+                'total_weight': 0,
+                'total_area': 0
+            })
+            stats['count'] += count
+            stats['total_quantity'] += total_quantity or 0
+            stats['total_weight'] += float(total_weight or 0)
+            stats['total_area'] += float(total_area or 0)
+
+        # Service branch breakdown
+        branch_rows = db.session.query(
+            InventoryItem.service_branch,
+            db.func.count(InventoryItem.id),
+            db.func.sum(InventoryItem.quantity)
+        ).filter(
+            InventoryItem.upload_id == upload_id
+        ).group_by(InventoryItem.service_branch).all()
 
-        for item in items:
-            # Category stats
-            cat = item.category or 'Uncategorized'
-            if cat not in category_stats:
-                category_stats[cat] = {
-                    'count': 0,
-                    'total_quantity': 0,
-                    'total_weight': 0,
-                    'total_area': 0
-                }
-            category_stats[cat]['count'] += 1
-            category_stats[cat]['total_quantity'] += item.quantity
-            category_stats[cat]['total_weight'] += (item.weight or 0) * item.quantity
-            category_stats[cat]['total_area'] += (item.area or 0) * item.quantity
-
-            # Service branch stats
-            branch = item.service_branch or 'Unassigned'
-            if branch not in service_branch_stats:
-                service_branch_stats[branch] = {
-                    'count': 0,
-                    'total_quantity': 0
-                }
-            service_branch_stats[branch]['count'] += 1
-            service_branch_stats[branch]['total_quantity'] += item.quantity
+        service_branch_stats = {}
+        for branch, count, total_quantity in branch_rows:
+            stats = service_branch_stats.setdefault(branch or 'Unassigned', {
+                'count': 0,
+                'total_quantity': 0
+            })
+            stats['count'] += count
+            stats['total_quantity'] += total_quantity or 0
 
         # Items requiring special handling
-        climate_controlled_count = upload.items.filter_by(requires_climate_control=True).count()
-        special_handling_count = upload.items.filter_by(requires_special_handling=True).count()
+        upload_items = InventoryItem.query.filter_by(upload_id=upload_id)
+        climate_controlled_count = upload_items.filter_by(requires_climate_control=True).count()
+        special_handling_count = upload_items.filter_by(requires_special_handling=True).count()
 
         return {
             'upload_id': upload.id,
@@ -268,7 +293,7 @@ class InventoryService:
             NotFound: If upload doesn't exist
         """
         upload = InventoryUpload.query.get_or_404(upload_id)
-        items = upload.items.all()
+        items = upload.items
 
         # Create workbook
         wb = Workbook()
@@ -24,6 +24,9 @@ setup(
             'pytest-cov>=4.1.0',
             'pytest-flask>=1.2.0',
             'pytest-mock>=3.11.0',
+            'pytest-xdist>=3.5.0',
+            'pytest-benchmark>=4.0.0',
+            'hypothesis>=6.0.0',
             'faker>=19.0.0',
         ],
     },
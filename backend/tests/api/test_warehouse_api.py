@@ -1,6 +1,10 @@
 """API tests for warehouse endpoints."""
 import pytest
 import json
+from tests.fixtures.sample_data import SAMPLE_WAREHOUSES
+
+# Placeholder in expected payloads for the id of the sample_warehouse row
+SAMPLE_WAREHOUSE_ID = object()
 
 
 @pytest.mark.api
@@ -16,15 +20,6 @@ class TestWarehouseAPI:
         assert isinstance(data, list)
         assert len(data) == 0
 
-    def test_get_warehouses(self, client, db, sample_warehouse):
-        """Test GET /warehouses."""
-        response = client.get('/api/v1/warehouses')
-
-        assert response.status_code == 200
-        data = response.get_json()
-        assert len(data) >= 1
-        assert data[0]['name'] == sample_warehouse.name
-
     def test_create_warehouse(self, client, db):
         """Test POST /warehouses to create a warehouse."""
         payload = {
@@ -63,51 +58,55 @@ class TestWarehouseAPI:
         # Should fail (conflict or bad request)
         assert response.status_code in [400, 409]
 
-    def test_get_warehouse_by_id(self, client, db, sample_warehouse):
-        """Test GET /warehouses/<id>."""
-        response = client.get(f'/api/v1/warehouses/{sample_warehouse.id}')
-
-        assert response.status_code == 200
-        data = response.get_json()
-        assert data['id'] == sample_warehouse.id
-        assert data['name'] == sample_warehouse.name
-        # Should include zones
-        assert 'zones' in data or 'zone_count' in data
-
     def test_get_warehouse_not_found(self, client, db):
         """Test GET /warehouses/<id> with invalid ID."""
         response = client.get('/api/v1/warehouses/99999')
 
         assert response.status_code == 404
 
-    def test_update_warehouse(self, client, db, sample_warehouse):
-        """Test PUT /warehouses/<id>."""
-        payload = {
-            'name': 'Updated Warehouse Name',
-            'description': 'Updated description'
-        }
-
-        response = client.put(
-            f'/api/v1/warehouses/{sample_warehouse.id}',
-            data=json.dumps(payload),
-            content_type='application/json'
-        )
-
-        assert response.status_code == 200
+    @pytest.mark.parametrize('verb,suffix,payload,status,expected', [
+        ('GET', '', None, 200, {'id': SAMPLE_WAREHOUSE_ID, 'name': SAMPLE_WAREHOUSES[0]['name']}),
+        (
+            'GET', '/{id}', None, 200,
+            {'id': SAMPLE_WAREHOUSE_ID, 'name': SAMPLE_WAREHOUSES[0]['name'], 'zone_count': 3}
+        ),
+        (
+            'PUT', '/{id}',
+            {'name': 'Updated Warehouse Name', 'description': 'Updated description'},
+            200,
+            {
+                'id': SAMPLE_WAREHOUSE_ID,
+                'name': 'Updated Warehouse Name',
+                'description': 'Updated description'
+            }
+        ),
+    ], ids=['list', 'get_by_id', 'update'])
+    def test_warehouse_crud(self, client, db, sample_warehouse,
+                            verb, suffix, payload, status, expected):
+        """Test GET/PUT against /warehouses and /warehouses/<id>."""
+        url = f'/api/v1/warehouses{suffix.format(id=sample_warehouse.id)}'
+
+        response = client.open(url, method=verb, json=payload)
+
+        assert response.status_code == status
         data = response.get_json()
-        assert data['name'] == 'Updated Warehouse Name'
-        assert data['description'] == 'Updated description'
+        if isinstance(data, list):
+            data = data[0]
+        for key, value in expected.items():
+            if value is SAMPLE_WAREHOUSE_ID:
+                value = sample_warehouse.id
+            assert data[key] == value
 
     def test_delete_warehouse(self, client, db, sample_warehouse):
         """Test DELETE /warehouses/<id>."""
-        warehouse_id = sample_warehouse.id
+        url = f'/api/v1/warehouses/{sample_warehouse.id}'
 
-        response = client.delete(f'/api/v1/warehouses/{warehouse_id}')
+        response = client.delete(url)
 
-        assert response.status_code in [200, 204]
+        assert response.status_code == 204
 
         # Verify deleted
-        get_response = client.get(f'/api/v1/warehouses/{warehouse_id}')
+        get_response = client.get(url)
         assert get_response.status_code == 404
 
 
@@ -148,7 +147,7 @@ class TestZoneAPI:
 
     def test_get_zone_by_id(self, client, db, sample_warehouse):
         """Test GET /warehouses/<id>/zones/<zone_id>."""
-        zone = sample_warehouse.zones.first()
+        zone = sample_warehouse.zones[0]
 
         response = client.get(
             f'/api/v1/warehouses/{sample_warehouse.id}/zones/{zone.id}'
@@ -161,7 +160,7 @@ class TestZoneAPI:
 
     def test_update_zone(self, client, db, sample_warehouse):
         """Test PUT /warehouses/<id>/zones/<zone_id>."""
-        zone = sample_warehouse.zones.first()
+        zone = sample_warehouse.zones[0]
         payload = {
             'name': 'Updated Zone Name',
             'area': 1200.0
@@ -180,7 +179,7 @@ class TestZoneAPI:
 
     def test_delete_zone(self, client, db, sample_warehouse):
         """Test DELETE /warehouses/<id>/zones/<zone_id>."""
-        zone = sample_warehouse.zones.first()
+        zone = sample_warehouse.zones[0]
         zone_id = zone.id
 
         response = client.delete(
@@ -4,13 +4,14 @@ import tempfile
 import os
 import sys
 from io import BytesIO
-from openpyxl import Workbook
-from werkzeug.datastructures import FileStorage
+from sqlalchemy import event, insert
+from sqlalchemy.orm import scoped_session, sessionmaker
 
 # Add tests directory to Python path
 sys.path.insert(0, os.path.dirname(__file__))
 
 from app import create_app
+from app.core.allocation_engine import AllocationEngine
 from app.extensions import db as _db
 from app.models.warehouse import Warehouse, Zone
 from app.models.inventory import InventoryUpload, InventoryItem
@@ -18,10 +19,19 @@ from fixtures.sample_data import (
     SAMPLE_WAREHOUSES,
     SAMPLE_ZONES,
     SAMPLE_ITEMS,
-    create_simple_zone,
     create_simple_item
 )
 
+# Sample warehouse totals, derived once from the static zone data
+SAMPLE_ZONES_TOTAL_AREA = sum(zone['area'] for zone in SAMPLE_ZONES)
+SAMPLE_ZONES_TOTAL_VOLUME = sum(zone['area'] * zone['height'] for zone in SAMPLE_ZONES)
+
+# Sample upload totals, derived once from the static item data
+SAMPLE_ITEMS_TOTAL_ENTRIES = len(SAMPLE_ITEMS)
+SAMPLE_ITEMS_TOTAL_ITEMS = sum(item['quantity'] for item in SAMPLE_ITEMS)
+SAMPLE_ITEMS_TOTAL_WEIGHT = sum(item['weight'] * item['quantity'] for item in SAMPLE_ITEMS)
+SAMPLE_ITEMS_TOTAL_AREA = sum(item['area'] * item['quantity'] for item in SAMPLE_ITEMS)
+
 
 @pytest.fixture(scope='session')
 def app():
@@ -36,26 +46,77 @@ def app():
         yield app
 
 
+def _configure_sqlite(engine):
+    """Register SQLite connection hooks for the test engine.
+
+    pysqlite does not emit BEGIN itself and so cannot nest SAVEPOINTs inside
+    an outer transaction; take over transaction control as described in the
+    SQLAlchemy SQLite dialect docs. Durability is irrelevant for a throwaway
+    test database, so journaling and fsync are turned off as well. Foreign
+    keys are enforced so ON DELETE CASCADE behaves as it does on PostgreSQL.
+
+    Args:
+        engine: SQLAlchemy engine, before any connection has been opened
+    """
+    @event.listens_for(engine, 'connect')
+    def _on_connect(dbapi_connection, connection_record):
+        dbapi_connection.isolation_level = None
+        cursor = dbapi_connection.cursor()
+        cursor.execute('PRAGMA journal_mode=MEMORY')
+        cursor.execute('PRAGMA synchronous=OFF')
+        cursor.execute('PRAGMA temp_store=MEMORY')
+        cursor.execute('PRAGMA foreign_keys=ON')
+        cursor.close()
+
+    @event.listens_for(engine, 'begin')
+    def _emit_begin(connection):
+        connection.exec_driver_sql('BEGIN')
+
+
+@pytest.fixture(scope='session')
+def _schema(app):
+    """Create the database schema once for the whole test session."""
+    if _db.engine.dialect.name == 'sqlite':
+        _configure_sqlite(_db.engine)
+
+    _db.create_all()
+
+    yield
+
+    _db.session.remove()
+    _db.drop_all()
+
+
 @pytest.fixture(scope='function')
-def db(app):
-    """Create a clean database for each test.
+def db(app, _schema, monkeypatch):
+    """Provide a database session that is rolled back after each test.
 
-    This fixture is function-scoped, meaning each test gets a fresh database.
+    Each test runs inside an outer transaction on a dedicated connection.
+    The session joins it with a SAVEPOINT, so ``db.session.commit()`` in tests
+    and services only releases the savepoint and everything is discarded on
+    teardown without re-creating the schema.
     """
     with app.app_context():
-        # Create all tables
-        _db.create_all()
+        connection = _db.engine.connect()
+        transaction = connection.begin()
+
+        # Bind a plain SQLAlchemy session straight to this connection; models
+        # reach it through ``db.session``, so ``Model.query`` follows along.
+        monkeypatch.setattr(_db, 'session', scoped_session(sessionmaker(
+            bind=connection,
+            join_transaction_mode='create_savepoint'
+        )))
 
         yield _db
 
-        # Drop all tables after test
         _db.session.remove()
-        _db.drop_all()
+        transaction.rollback()
+        connection.close()
 
 
-@pytest.fixture
+@pytest.fixture(scope='session')
 def client(app):
-    """Create a Flask test client.
+    """Create a Flask test client shared by the whole test session.
 
     Used for testing API endpoints without starting a server.
     """
@@ -73,28 +134,46 @@ def sample_warehouse(db):
         name=SAMPLE_WAREHOUSES[0]['name'],
         warehouse_type=SAMPLE_WAREHOUSES[0]['warehouse_type'],
         description=SAMPLE_WAREHOUSES[0]['description'],
-        is_custom=True
+        is_custom=True,
+        total_area=SAMPLE_ZONES_TOTAL_AREA,
+        total_volume=SAMPLE_ZONES_TOTAL_VOLUME
     )
     db.session.add(warehouse)
     db.session.flush()  # Get warehouse ID
 
-    # Add three different types of zones
-    for zone_data in SAMPLE_ZONES:
-        zone = Zone(
-            warehouse_id=warehouse.id,
-            **zone_data
-        )
-        zone.calculate_volume()
-        db.session.add(zone)
+    # Add three different types of zones in a single bulk INSERT
+    zone_rows = [
+        {
+            **zone_data,
+            'warehouse_id': warehouse.id,
+            'volume': zone_data['area'] * zone_data['height']
+        }
+        for zone_data in SAMPLE_ZONES
+    ]
+    db.session.execute(insert(Zone), zone_rows)
+    db.session.flush()
 
-    db.session.commit()
+    return warehouse
 
-    # Refresh to get relationships
-    db.session.refresh(warehouse)
-    warehouse.calculate_totals()
-    db.session.commit()
 
-    return warehouse
+@pytest.fixture(scope='session')
+def engine_factory():
+    """Return a callable that hands out one AllocationEngine per BSF factor.
+
+    The engine keeps no state between allocate() calls, so instances are
+    shared across the whole session.
+
+    Returns:
+        Callable[[float], AllocationEngine]: Engine lookup by BSF factor
+    """
+    engines = {}
+
+    def get(bsf_factor):
+        if bsf_factor not in engines:
+            engines[bsf_factor] = AllocationEngine(bsf_factor=bsf_factor)
+        return engines[bsf_factor]
+
+    return get
 
 
 @pytest.fixture
@@ -146,26 +225,33 @@ def sample_inventory_upload(db):
         upload_name='Test Upload',
         filename='test_inventory.xlsx',
         site='Test Site',
-        bsf_factor=0.63
+        bsf_factor=0.63,
+        total_entries=SAMPLE_ITEMS_TOTAL_ENTRIES,
+        total_items=SAMPLE_ITEMS_TOTAL_ITEMS,
+        total_weight=SAMPLE_ITEMS_TOTAL_WEIGHT,
+        total_area=SAMPLE_ITEMS_TOTAL_AREA
     )
     db.session.add(upload)
     db.session.flush()  # Get upload ID
 
-    # Add sample items
-    for idx, item_data in enumerate(SAMPLE_ITEMS, start=1):
-        item = InventoryItem(
-            upload_id=upload.id,
-            **item_data
-        )
-        db.session.add(item)
+    # Add sample items in a single bulk INSERT
+    db.session.execute(
+        insert(InventoryItem),
+        [{**item_data, 'upload_id': upload.id} for item_data in SAMPLE_ITEMS]
+    )
+    db.session.flush()
 
-    db.session.commit()
+    return upload
 
-    # Calculate totals
-    upload.calculate_totals()
-    db.session.commit()
 
-    return upload
+@pytest.fixture
+def sample_category():
+    """Return the category of the first item in sample_inventory_upload.
+
+    Returns:
+        str: Item category
+    """
+    return SAMPLE_ITEMS[0]['category']
 
 
 @pytest.fixture
@@ -183,13 +269,15 @@ def sample_items_dict():
     return items
 
 
-@pytest.fixture
-def sample_excel_file():
-    """Create a temporary Excel file with sample inventory data.
+@pytest.fixture(scope='session')
+def _sample_excel_bytes():
+    """Build the sample inventory workbook once per session.
 
     Returns:
-        BytesIO: In-memory Excel file suitable for upload testing
+        bytes: Serialized .xlsx content
     """
+    from openpyxl import Workbook
+
     # Create a workbook
     wb = Workbook()
     ws = wb.active
@@ -213,26 +301,37 @@ def sample_excel_file():
     for row in sample_rows:
         ws.append(row)
 
-    # Save to BytesIO
+    # Serialize to bytes
     excel_file = BytesIO()
     wb.save(excel_file)
-    excel_file.seek(0)
 
-    return excel_file
+    return excel_file.getvalue()
+
+
+@pytest.fixture
+def sample_excel_file(_sample_excel_bytes):
+    """Create an in-memory Excel file with sample inventory data.
+
+    Returns:
+        BytesIO: In-memory Excel file suitable for upload testing
+    """
+    return BytesIO(_sample_excel_bytes)
 
 
 @pytest.fixture
-def mock_file_upload(sample_excel_file):
+def mock_file_upload(_sample_excel_bytes):
     """Create a mock werkzeug FileStorage object for testing file uploads.
 
     Args:
-        sample_excel_file: Excel file fixture
+        _sample_excel_bytes: Cached Excel file content
 
     Returns:
         FileStorage: Mock file upload object
     """
+    from werkzeug.datastructures import FileStorage
+
     return FileStorage(
-        stream=sample_excel_file,
+        stream=BytesIO(_sample_excel_bytes),
         filename='test_inventory.xlsx',
         content_type='application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
     )
@@ -256,30 +355,6 @@ def empty_warehouse(db):
     return warehouse
 
 
-@pytest.fixture
-def simple_zone_dict():
-    """Create a simple zone dictionary for testing.
-
-    Returns:
-        Dict: A simple zone with id
-    """
-    zone = create_simple_zone()
-    zone['id'] = 1
-    return zone
-
-
-@pytest.fixture
-def simple_item_dict():
-    """Create a simple item dictionary for testing.
-
-    Returns:
-        Dict: A simple item with id
-    """
-    item = create_simple_item()
-    item['id'] = 1
-    return item
-
-
 @pytest.fixture
 def tall_item_dict():
     """Create a tall item that requires high ceiling.
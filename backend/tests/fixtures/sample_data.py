@@ -1,9 +1,16 @@
 """Sample test data for warehouse capacity planner tests."""
-from typing import Dict, List, Any
+from functools import lru_cache
+from types import MappingProxyType
+from typing import Dict, List, Any, Mapping, Tuple
+
+
+def _freeze(records: List[Dict[str, Any]]) -> Tuple[Mapping[str, Any], ...]:
+    """Return records as a tuple of read-only mappings."""
+    return tuple(MappingProxyType(record) for record in records)
 
 
 # Sample Warehouses
-SAMPLE_WAREHOUSES = [
+SAMPLE_WAREHOUSES = _freeze([
     {
         'name': 'Test Warehouse 1',
         'warehouse_type': 'Distribution Center',
@@ -16,11 +23,11 @@ SAMPLE_WAREHOUSES = [
         'description': 'Climate-controlled test warehouse',
         'is_custom': True
     }
-]
+])
 
 
 # Sample Zones
-SAMPLE_ZONES = [
+SAMPLE_ZONES = _freeze([
     {
         'name': 'Zone A - Standard',
         'area': 1000.0,
@@ -50,11 +57,11 @@ SAMPLE_ZONES = [
         'climate_controlled': False,
         'special_handling': True
     }
-]
+])
 
 
 # Sample Inventory Items
-SAMPLE_ITEMS = [
+SAMPLE_ITEMS = _freeze([
     {
         'name': 'Standard Pallet 1',
         'description': 'Standard pallet with regular items',
@@ -130,11 +137,11 @@ SAMPLE_ITEMS = [
         'requires_climate_control': False,
         'requires_special_handling': True
     }
-]
+])
 
 
 # Sample Inventory Items with Priority
-SAMPLE_ITEMS_WITH_PRIORITY = [
+SAMPLE_ITEMS_WITH_PRIORITY = _freeze([
     {
         'name': 'Priority 1 Item',
         'description': 'Highest priority item',
@@ -179,34 +186,30 @@ SAMPLE_ITEMS_WITH_PRIORITY = [
         'requires_climate_control': False,
         'requires_special_handling': False
     }
-]
+])
 
 
 def create_sample_warehouse_dict() -> Dict[str, Any]:
     """Create a sample warehouse dictionary for testing."""
-    return SAMPLE_WAREHOUSES[0].copy()
+    return dict(SAMPLE_WAREHOUSES[0])
 
 
 def create_sample_zones_dict() -> List[Dict[str, Any]]:
     """Create sample zones dictionary for testing."""
-    return [zone.copy() for zone in SAMPLE_ZONES]
+    return [dict(zone) for zone in SAMPLE_ZONES]
 
 
 def create_sample_items_dict() -> List[Dict[str, Any]]:
     """Create sample items dictionary for testing."""
-    return [item.copy() for item in SAMPLE_ITEMS]
+    return [dict(item) for item in SAMPLE_ITEMS]
 
 
-def create_simple_item(name: str = "Test Item",
-                      height: float = 6.0,
-                      area: float = 16.0,
-                      weight: float = 1000.0,
-                      psf: float = 62.5,
-                      quantity: int = 1,
-                      requires_climate: bool = False,
-                      requires_special: bool = False) -> Dict[str, Any]:
-    """Create a simple test item with specified dimensions."""
-    return {
+@lru_cache(maxsize=None)
+def _simple_item(name: str, height: float, area: float, weight: float, psf: float,
+                 quantity: int, requires_climate: bool,
+                 requires_special: bool) -> Mapping[str, Any]:
+    """Build and cache a read-only simple item template."""
+    return MappingProxyType({
         'name': name,
         'description': f'Test item: {name}',
         'quantity': quantity,
@@ -220,17 +223,14 @@ def create_simple_item(name: str = "Test Item",
         'service_branch': 'Navy',
         'requires_climate_control': requires_climate,
         'requires_special_handling': requires_special
-    }
+    })
 
 
-def create_simple_zone(name: str = "Test Zone",
-                      area: float = 1000.0,
-                      height: float = 12.0,
-                      strength: float = 300.0,
-                      climate_controlled: bool = False,
-                      special_handling: bool = False) -> Dict[str, Any]:
-    """Create a simple test zone with specified specifications."""
-    return {
+@lru_cache(maxsize=None)
+def _simple_zone(name: str, area: float, height: float, strength: float,
+                 climate_controlled: bool, special_handling: bool) -> Mapping[str, Any]:
+    """Build and cache a read-only simple zone template."""
+    return MappingProxyType({
         'name': name,
         'area': area,
         'height': height,
@@ -238,4 +238,39 @@ def create_simple_zone(name: str = "Test Zone",
         'zone_order': 1,
         'climate_controlled': climate_controlled,
         'special_handling': special_handling
-    }
+    })
+
+
+def create_simple_item(name: str = "Test Item",
+                      height: float = 6.0,
+                      area: float = 16.0,
+                      weight: float = 1000.0,
+                      psf: float = 62.5,
+                      quantity: int = 1,
+                      requires_climate: bool = False,
+                      requires_special: bool = False) -> Dict[str, Any]:
+    """Create a simple test item with specified dimensions.
+
+    Returns a fresh copy of a cached template, so callers may mutate it.
+    """
+    return dict(_simple_item(name, height, area, weight, psf, quantity,
+                             requires_climate, requires_special))
+
+
+def create_simple_zone(name: str = "Test Zone",
+                      area: float = 1000.0,
+                      height: float = 12.0,
+                      strength: float = 300.0,
+                      climate_controlled: bool = False,
+                      special_handling: bool = False) -> Dict[str, Any]:
+    """Create a simple test zone with specified specifications.
+
+    Returns a fresh copy of a cached template, so callers may mutate it.
+    """
+    return dict(_simple_zone(name, area, height, strength,
+                             climate_controlled, special_handling))
+
+
+# Read-only single item/zone with ids, for tests that pass them to the engine as-is
+SIMPLE_ITEM_TEMPLATE = MappingProxyType({**create_simple_item(), 'id': 1})
+SIMPLE_ZONE_TEMPLATE = MappingProxyType({**create_simple_zone(), 'id': 1})
@@ -2,12 +2,29 @@
 import pytest
 from app.services.allocation_service import AllocationService
 from app.models.allocation import AllocationResult
+from app.models.inventory import InventoryUpload
+
+
+@pytest.fixture
+def stub_upload(db):
+    """Create an inventory upload with no items.
+
+    Enough for validation paths that only need the upload row to exist.
+
+    Returns:
+        InventoryUpload: An empty upload
+    """
+    upload = InventoryUpload(upload_name='Stub Upload', filename='stub.xlsx')
+    db.session.add(upload)
+    db.session.commit()
+    return upload
 
 
 @pytest.mark.integration
 class TestAllocationServiceRunAllocation:
     """Test AllocationService.run_allocation() method."""
 
+    @pytest.mark.slow
     def test_run_allocation_success(self, db, sample_warehouse, sample_inventory_upload):
         """Test successful allocation."""
         result = AllocationService.run_allocation(
@@ -26,51 +43,45 @@ class TestAllocationServiceRunAllocation:
         assert result.result_name == 'Test Allocation'
         assert result.allocation_data is not None
 
-    def test_run_allocation_invalid_upload_id(self, db, sample_warehouse):
+    def test_run_allocation_invalid_upload_id(self, db):
         """Test allocation with invalid upload ID."""
         with pytest.raises(ValueError, match="Inventory upload .* not found"):
             AllocationService.run_allocation(
                 upload_id=99999,
-                warehouse_id=sample_warehouse.id,
+                warehouse_id=99999,
                 bsf_factor=0.63
             )
 
-    def test_run_allocation_invalid_warehouse_id(self, db, sample_inventory_upload):
+    def test_run_allocation_invalid_warehouse_id(self, db, stub_upload):
         """Test allocation with invalid warehouse ID."""
         with pytest.raises(ValueError, match="Warehouse .* not found"):
             AllocationService.run_allocation(
-                upload_id=sample_inventory_upload.id,
+                upload_id=stub_upload.id,
                 warehouse_id=99999,
                 bsf_factor=0.63
             )
 
-    def test_run_allocation_bsf_below_zero(self, db, sample_warehouse, sample_inventory_upload):
-        """Test allocation with BSF factor below 0."""
+    @pytest.mark.parametrize('bsf', [-1.0, -0.1, 1.5, 2.0])
+    def test_run_allocation_bsf_out_of_range(self, db, bsf):
+        """Test allocation with BSF factor outside 0.0 - 1.0."""
+        # BSF is validated before any lookup, so the IDs need not exist
         with pytest.raises(ValueError, match="BSF factor must be between 0.0 and 1.0"):
             AllocationService.run_allocation(
-                upload_id=sample_inventory_upload.id,
-                warehouse_id=sample_warehouse.id,
-                bsf_factor=-0.1
-            )
-
-    def test_run_allocation_bsf_above_one(self, db, sample_warehouse, sample_inventory_upload):
-        """Test allocation with BSF factor above 1.0."""
-        with pytest.raises(ValueError, match="BSF factor must be between 0.0 and 1.0"):
-            AllocationService.run_allocation(
-                upload_id=sample_inventory_upload.id,
-                warehouse_id=sample_warehouse.id,
-                bsf_factor=1.5
+                upload_id=99999,
+                warehouse_id=99999,
+                bsf_factor=bsf
             )
 
-    def test_run_allocation_warehouse_no_zones(self, db, empty_warehouse, sample_inventory_upload):
+    def test_run_allocation_warehouse_no_zones(self, db, empty_warehouse, stub_upload):
         """Test allocation with warehouse that has no zones."""
         with pytest.raises(ValueError, match="has no zones defined"):
             AllocationService.run_allocation(
-                upload_id=sample_inventory_upload.id,
+                upload_id=stub_upload.id,
                 warehouse_id=empty_warehouse.id,
                 bsf_factor=0.63
             )
 
+    @pytest.mark.slow
     def test_run_allocation_stores_summary_data(self, db, sample_warehouse, sample_inventory_upload):
         """Test that allocation stores summary statistics."""
         result = AllocationService.run_allocation(
@@ -84,6 +95,7 @@ class TestAllocationServiceRunAllocation:
         assert result.total_allocated + result.total_failed > 0
         assert result.overall_fit is not None
 
+    @pytest.mark.slow
     def test_run_allocation_with_default_bsf(self, db, sample_warehouse, sample_inventory_upload):
         """Test allocation with default BSF factor."""
         result = AllocationService.run_allocation(
@@ -94,6 +106,7 @@ class TestAllocationServiceRunAllocation:
 
         assert float(result.bsf_factor) == pytest.approx(0.63)
 
+    @pytest.mark.slow
     def test_run_allocation_with_zero_bsf(self, db, sample_warehouse, sample_inventory_upload):
         """Test allocation with zero BSF factor (no additional space)."""
         result = AllocationService.run_allocation(
@@ -107,44 +120,53 @@ class TestAllocationServiceRunAllocation:
         assert result is not None
 
 
+@pytest.fixture
+def precomputed_allocation(db, sample_warehouse, sample_inventory_upload):
+    """Run one allocation for tests that only need a stored result.
+
+    Returns:
+        AllocationResult: Result named 'Result 1' with the default BSF factor
+    """
+    return AllocationService.run_allocation(
+        upload_id=sample_inventory_upload.id,
+        warehouse_id=sample_warehouse.id,
+        result_name='Result 1'
+    )
+
+
+@pytest.fixture
+def two_allocations(db, sample_warehouse, sample_inventory_upload, precomputed_allocation):
+    """Pair the precomputed allocation with a second run at a lower BSF factor.
+
+    Returns:
+        tuple: Two AllocationResult objects ('Result 1' at 0.63, 'Result 2' at 0.5)
+    """
+    second = AllocationService.run_allocation(
+        upload_id=sample_inventory_upload.id,
+        warehouse_id=sample_warehouse.id,
+        bsf_factor=0.5,
+        result_name='Result 2'
+    )
+    return precomputed_allocation, second
+
+
 @pytest.mark.integration
 class TestAllocationServiceRetrieval:
     """Test AllocationService retrieval methods."""
 
-    def test_get_allocation_result(self, db, sample_warehouse, sample_inventory_upload):
+    @pytest.mark.slow
+    def test_get_allocation_result(self, db, precomputed_allocation):
         """Test retrieving an allocation result."""
-        # Create result first
-        result = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id,
-            bsf_factor=0.63
-        )
-
-        # Retrieve it
-        retrieved = AllocationService.get_allocation_result(result.id)
+        retrieved = AllocationService.get_allocation_result(precomputed_allocation.id)
 
         assert retrieved is not None
-        assert retrieved.id == result.id
+        assert retrieved.id == precomputed_allocation.id
         assert retrieved.allocation_data is not None
 
-    def test_get_allocation_result_not_found(self, db):
-        """Test retrieving non-existent allocation result."""
-        with pytest.raises(ValueError, match="Allocation result .* not found"):
-            AllocationService.get_allocation_result(99999)
-
-    def test_get_all_allocation_results(self, db, sample_warehouse, sample_inventory_upload):
+    @pytest.mark.slow
+    def test_get_all_allocation_results(self, db, two_allocations):
         """Test retrieving all allocation results."""
-        # Create multiple results
-        result1 = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id,
-            result_name='Result 1'
-        )
-        result2 = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id,
-            result_name='Result 2'
-        )
+        result1, result2 = two_allocations
 
         # Retrieve all
         results = AllocationService.get_all_allocation_results()
@@ -154,14 +176,10 @@ class TestAllocationServiceRetrieval:
         assert result1.id in result_ids
         assert result2.id in result_ids
 
-    def test_delete_allocation_result(self, db, sample_warehouse, sample_inventory_upload):
+    @pytest.mark.slow
+    def test_delete_allocation_result(self, db, precomputed_allocation):
         """Test deleting an allocation result."""
-        # Create result
-        result = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id
-        )
-        result_id = result.id
+        result_id = precomputed_allocation.id
 
         # Delete it (returns None on success)
         AllocationService.delete_allocation_result(result_id)
@@ -170,31 +188,16 @@ class TestAllocationServiceRetrieval:
         with pytest.raises(ValueError, match="Allocation result .* not found"):
             AllocationService.get_allocation_result(result_id)
 
-    def test_delete_allocation_result_not_found(self, db):
-        """Test deleting non-existent allocation result."""
-        with pytest.raises(ValueError, match="Allocation result .* not found"):
-            AllocationService.delete_allocation_result(99999)
-
 
 @pytest.mark.integration
 class TestAllocationServiceComparison:
     """Test AllocationService comparison functionality."""
 
-    def test_compare_allocations(self, db, sample_warehouse, sample_inventory_upload):
+    @pytest.mark.slow
+    def test_compare_allocations(self, db, two_allocations):
         """Test comparing multiple allocation results."""
-        # Create results with different BSF factors
-        result1 = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id,
-            bsf_factor=0.5,
-            result_name='BSF 0.5'
-        )
-        result2 = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id,
-            bsf_factor=0.63,
-            result_name='BSF 0.63'
-        )
+        # Results were run with different BSF factors
+        result1, result2 = two_allocations
 
         # Compare them
         comparison = AllocationService.compare_allocations([result1.id, result2.id])
@@ -205,19 +208,30 @@ class TestAllocationServiceComparison:
         assert 'best_fit' in comparison
         assert 'best_utilization' in comparison
 
-    def test_compare_allocations_empty_list(self, db):
-        """Test comparison with empty list."""
+    def test_compare_allocations_empty_list(self):
+        """Test comparison with empty list (no database access)."""
         comparison = AllocationService.compare_allocations([])
         assert comparison is not None
         assert comparison['results'] == []
 
-    def test_compare_allocations_invalid_id(self, db, sample_warehouse, sample_inventory_upload):
+    @pytest.mark.slow
+    def test_compare_allocations_invalid_id(self, db, precomputed_allocation):
         """Test comparison with invalid result ID."""
-        result1 = AllocationService.run_allocation(
-            upload_id=sample_inventory_upload.id,
-            warehouse_id=sample_warehouse.id
-        )
-
         # Include invalid ID - should raise ValueError
         with pytest.raises(ValueError, match="Allocation result .* not found"):
-            AllocationService.compare_allocations([result1.id, 99999])
+            AllocationService.compare_allocations([precomputed_allocation.id, 99999])
+
+
+@pytest.mark.integration
+class TestAllocationServiceNotFound:
+    """Test AllocationService methods with non-existent allocation results."""
+
+    @pytest.mark.parametrize('fn,args', [
+        (AllocationService.get_allocation_result, (99999,)),
+        (AllocationService.delete_allocation_result, (99999,)),
+        (AllocationService.compare_allocations, ([99999],)),
+    ], ids=['get', 'delete', 'compare'])
+    def test_not_found(self, db, fn, args):
+        """Test that unknown result IDs raise ValueError."""
+        with pytest.raises(ValueError, match="Allocation result .* not found"):
+            fn(*args)
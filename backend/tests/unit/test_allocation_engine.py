@@ -4,20 +4,39 @@ This test module aims for 100% coverage of the allocation engine,
 which is the most critical business logic component.
 """
 import pytest
-from app.core.allocation_engine import AllocationEngine
-from tests.fixtures.sample_data import create_simple_zone, create_simple_item
+from hypothesis import given, settings, strategies as st
+from tests.fixtures.sample_data import (
+    SIMPLE_ITEM_TEMPLATE,
+    SIMPLE_ZONE_TEMPLATE,
+    create_simple_zone,
+    create_simple_item
+)
+
+# Absolute tolerance for float results of the area arithmetic
+EPS = 1e-6
+
+# Items drawn from small value sets so ties in every sort key are common
+_sort_item_strategy = st.builds(
+    lambda height, weight, priority: {
+        **create_simple_item(height=height, weight=weight),
+        'priority_order': priority
+    },
+    height=st.sampled_from([5.0, 6.0, 7.0, 10.0]),
+    weight=st.sampled_from([500.0, 1000.0]),
+    priority=st.sampled_from([1, 2, 999])
+)
 
 
 @pytest.mark.unit
 class TestAllocationEngineBasic:
     """Test basic allocation functionality."""
 
-    def test_allocate_single_item(self, simple_zone_dict, simple_item_dict):
+    def test_allocate_single_item(self, engine_factory):
         """Test allocating a single item to a single zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         result = engine.allocate(
-            items=[simple_item_dict],
-            zones=[simple_zone_dict]
+            items=[SIMPLE_ITEM_TEMPLATE],
+            zones=[SIMPLE_ZONE_TEMPLATE]
         )
 
         assert result['overall_fit'] is True
@@ -30,9 +49,9 @@ class TestAllocationEngineBasic:
         assert zone_alloc['allocated_items'][0]['quantity'] == 1
         assert zone_alloc['area_utilization'] > 0
 
-    def test_allocate_multiple_items_same_type(self):
+    def test_allocate_multiple_items_same_type(self, engine_factory):
         """Test allocating multiple items of the same type."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         item = create_simple_item(quantity=5)
         item['id'] = 1
         zone = create_simple_zone(area=500.0)
@@ -47,9 +66,9 @@ class TestAllocationEngineBasic:
         assert len(zone_alloc['allocated_items']) == 1
         assert zone_alloc['allocated_items'][0]['quantity'] == 5
 
-    def test_allocate_multiple_different_items(self):
+    def test_allocate_multiple_different_items(self, engine_factory):
         """Test allocating multiple different item types."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         items = [
             {**create_simple_item(name='Item 1', quantity=2), 'id': 1},
             {**create_simple_item(name='Item 2', quantity=3), 'id': 2}
@@ -69,34 +88,58 @@ class TestAllocationEngineBasic:
 class TestAllocationEngineConstraints:
     """Test constraint validation in allocation."""
 
-    def test_height_constraint_success(self):
-        """Test that item fits when height is within limit."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(height=10.0), 'id': 1}
-        zone = {**create_simple_zone(height=12.0), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is True
-        assert len(result['failures']) == 0
-
-    def test_height_constraint_failure(self):
-        """Test that item fails when too tall for all zones."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(height=15.0), 'id': 1}
-        zone = {**create_simple_zone(height=12.0), 'id': 1}
+    @pytest.mark.parametrize('item_kw,zone_kw,fit,reason,can_fit', [
+        pytest.param(dict(height=10.0), dict(height=12.0), True, None, None,
+                     id='height-within-limit'),
+        pytest.param(dict(height=15.0), dict(height=12.0), False, 'Height too tall', False,
+                     id='height-too-tall'),
+        # Required area = 100 * (1 + 0.63) = 163, exceeds 150
+        pytest.param(dict(area=100.0, quantity=1), dict(area=150.0), False, 'Area too large', True,
+                     id='area-with-bsf-too-large'),
+        pytest.param(dict(psf=250.0), dict(strength=300.0), True, None, None,
+                     id='psf-within-strength'),
+        pytest.param(dict(psf=400.0), dict(strength=300.0), False, 'Too heavy (400', False,
+                     id='psf-too-heavy'),
+        pytest.param(dict(requires_climate=True), dict(climate_controlled=True), True, None, None,
+                     id='climate-zone-available'),
+        pytest.param(dict(requires_climate=True), dict(climate_controlled=False), False,
+                     'Requires climate control (no zones available)', None,
+                     id='climate-no-zones'),
+        pytest.param(dict(requires_special=True), dict(special_handling=True), True, None, None,
+                     id='special-zone-available'),
+        pytest.param(dict(requires_special=True), dict(special_handling=False), False,
+                     'Requires special handling (no zones available)', None,
+                     id='special-no-zones'),
+        # Climate zone exists but lacks space, so the reason is space, not missing zones
+        pytest.param(dict(requires_climate=True, area=200.0),
+                     dict(area=100.0, climate_controlled=True), False,
+                     'no space in climate zones', None,
+                     id='climate-no-space'),
+    ])
+    def test_constraint_matrix(self, engine_factory, item_kw, zone_kw, fit, reason, can_fit):
+        """Test single item/zone constraint outcomes and failure reasons."""
+        engine = engine_factory(0.63)
+        item = {**create_simple_item(**item_kw), 'id': 1}
+        zone = {**create_simple_zone(**zone_kw), 'id': 1}
 
         result = engine.allocate(items=[item], zones=[zone])
 
-        assert result['overall_fit'] is False
-        assert len(result['failures']) == 1
-        failure = result['failures'][0]
-        assert 'Height too tall' in failure['failure_reason']
-        assert failure['can_theoretically_fit'] is False
-
-    def test_area_constraint_with_bsf(self):
+        assert result['overall_fit'] is fit
+        if fit:
+            assert len(result['failures']) == 0
+            allocated = result['zone_allocations'][0]['allocated_items'][0]
+            assert allocated['requires_climate_control'] is item['requires_climate_control']
+            assert allocated['requires_special_handling'] is item['requires_special_handling']
+        else:
+            assert len(result['failures']) == 1
+            failure = result['failures'][0]
+            assert reason in failure['failure_reason']
+            if can_fit is not None:
+                assert failure['can_theoretically_fit'] is can_fit
+
+    def test_area_constraint_with_bsf(self, engine_factory):
         """Test that BSF factor is applied to area calculation."""
-        engine = AllocationEngine(bsf_factor=0.5)  # 50% additional space
+        engine = engine_factory(0.5)  # 50% additional space
         item = {**create_simple_item(area=100.0, quantity=1), 'id': 1}
         zone = {**create_simple_zone(area=200.0), 'id': 1}
 
@@ -107,184 +150,45 @@ class TestAllocationEngineConstraints:
         assert result['overall_fit'] is True
         zone_alloc = result['zone_allocations'][0]
         # Remaining should be 200 - 150 = 50
-        assert zone_alloc['remaining_area'] == pytest.approx(50.0)
-
-    def test_area_constraint_failure(self):
-        """Test that item fails when area (with BSF) exceeds available space."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(area=100.0, quantity=1), 'id': 1}
-        zone = {**create_simple_zone(area=150.0), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        # Required area = 100 * (1 + 0.63) = 163, exceeds 150
-        assert result['overall_fit'] is False
-        assert len(result['failures']) == 1
-        failure = result['failures'][0]
-        assert 'Area too large' in failure['failure_reason']
-        assert failure['can_theoretically_fit'] is True  # Could fit if zone was bigger
-
-    def test_psf_constraint_success(self):
-        """Test that item fits when PSF is within strength limit."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(psf=250.0), 'id': 1}
-        zone = {**create_simple_zone(strength=300.0), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is True
-
-    def test_psf_constraint_failure(self):
-        """Test that item fails when PSF exceeds floor strength."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(psf=400.0), 'id': 1}
-        zone = {**create_simple_zone(strength=300.0), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is False
-        assert len(result['failures']) == 1
-        failure = result['failures'][0]
-        assert 'Too heavy' in failure['failure_reason']
-        assert '400' in failure['failure_reason']
-        assert failure['can_theoretically_fit'] is False
-
-    def test_climate_control_requirement_success(self):
-        """Test that climate item allocates to climate zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(requires_climate=True), 'id': 1}
-        zone = {**create_simple_zone(climate_controlled=True), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is True
-        zone_alloc = result['zone_allocations'][0]
-        assert zone_alloc['allocated_items'][0]['requires_climate_control'] is True
-
-    def test_climate_control_requirement_failure_no_zones(self):
-        """Test that climate item fails when no climate zones available."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(requires_climate=True), 'id': 1}
-        zone = {**create_simple_zone(climate_controlled=False), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is False
-        failure = result['failures'][0]
-        assert 'Requires climate control (no zones available)' in failure['failure_reason']
-
-    def test_special_handling_requirement_success(self):
-        """Test that special item allocates to special handling zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(requires_special=True), 'id': 1}
-        zone = {**create_simple_zone(special_handling=True), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is True
-        zone_alloc = result['zone_allocations'][0]
-        assert zone_alloc['allocated_items'][0]['requires_special_handling'] is True
-
-    def test_special_handling_requirement_failure_no_zones(self):
-        """Test that special item fails when no special handling zones available."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        item = {**create_simple_item(requires_special=True), 'id': 1}
-        zone = {**create_simple_zone(special_handling=False), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is False
-        failure = result['failures'][0]
-        assert 'Requires special handling (no zones available)' in failure['failure_reason']
-
-    def test_climate_requirement_failure_insufficient_space(self):
-        """Test climate item fails when climate zone exists but lacks space."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        # Large item requiring climate
-        item = {**create_simple_item(requires_climate=True, area=200.0), 'id': 1}
-        # Small climate zone
-        zone = {**create_simple_zone(area=100.0, climate_controlled=True), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        assert result['overall_fit'] is False
-        failure = result['failures'][0]
-        # Should indicate space issue in climate zones, not missing zones
-        assert 'no space in climate zones' in failure['failure_reason']
+        assert abs(zone_alloc['remaining_area'] - 50.0) < EPS
 
 
 @pytest.mark.unit
 class TestAllocationEngineSorting:
     """Test item sorting logic."""
 
-    def test_height_first_sorting(self):
-        """Test that items are sorted by height (tallest first) when no priority."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        items = [
-            {**create_simple_item(name='Short', height=5.0), 'id': 1},
-            {**create_simple_item(name='Tall', height=10.0), 'id': 2},
-            {**create_simple_item(name='Medium', height=7.0), 'id': 3}
-        ]
-
-        sorted_items = engine._sort_items(items)
+    @settings(max_examples=50, deadline=None)
+    @given(st.lists(_sort_item_strategy, min_size=1, max_size=20))
+    def test_sort_invariants(self, engine_factory, items):
+        """Test priority, then height (tallest first), then weight (heaviest first).
 
-        # Should be sorted: Tall (10), Medium (7), Short (5)
-        assert sorted_items[0]['name'] == 'Tall'
-        assert sorted_items[1]['name'] == 'Medium'
-        assert sorted_items[2]['name'] == 'Short'
+        Without any priority other than the 999 default, items sort by height
+        and weight only. Items with equal keys keep their input order.
+        """
+        engine = engine_factory(0.63)
+        items = [{**item, 'id': idx} for idx, item in enumerate(items)]
+        has_priority = any(item['priority_order'] != 999 for item in items)
 
-    def test_weight_as_tie_breaker(self):
-        """Test that weight is used as tie-breaker when heights are equal."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        items = [
-            {**create_simple_item(name='Light', height=6.0, weight=500.0), 'id': 1},
-            {**create_simple_item(name='Heavy', height=6.0, weight=1000.0), 'id': 2}
-        ]
-
-        sorted_items = engine._sort_items(items)
-
-        # Same height, heavier comes first
-        assert sorted_items[0]['name'] == 'Heavy'
-        assert sorted_items[1]['name'] == 'Light'
-
-    def test_priority_based_sorting(self):
-        """Test that items with priority are sorted by priority first."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        items = [
-            {**create_simple_item(name='No Priority', height=10.0), 'id': 1, 'priority_order': 999},
-            {**create_simple_item(name='Priority 2', height=5.0), 'id': 2, 'priority_order': 2},
-            {**create_simple_item(name='Priority 1', height=7.0), 'id': 3, 'priority_order': 1}
-        ]
-
-        sorted_items = engine._sort_items(items)
-
-        # Should be sorted by priority: 1, 2, 999
-        assert sorted_items[0]['name'] == 'Priority 1'
-        assert sorted_items[1]['name'] == 'Priority 2'
-        assert sorted_items[2]['name'] == 'No Priority'
-
-    def test_height_within_priority_group(self):
-        """Test that height sorting applies within same priority group."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        items = [
-            {**create_simple_item(name='P1 Short', height=5.0), 'id': 1, 'priority_order': 1},
-            {**create_simple_item(name='P1 Tall', height=10.0), 'id': 2, 'priority_order': 1}
-        ]
+        def key(item):
+            height_weight = (-item['height'], -item['weight'])
+            return ((item['priority_order'],) if has_priority else ()) + height_weight
 
-        sorted_items = engine._sort_items(items)
+        sorted_items = engine._sort_items(list(items))
 
-        # Same priority, tallest first
-        assert sorted_items[0]['name'] == 'P1 Tall'
-        assert sorted_items[1]['name'] == 'P1 Short'
+        assert sorted(item['id'] for item in sorted_items) == list(range(len(items)))
+        for a, b in zip(sorted_items, sorted_items[1:]):
+            assert key(a) <= key(b)
+            if key(a) == key(b):
+                assert a['id'] < b['id']
 
 
 @pytest.mark.unit
 class TestAllocationEngineZoneSelection:
     """Test zone selection and priority logic."""
 
-    def test_zone_selection_minimal_height_waste(self):
+    def test_zone_selection_minimal_height_waste(self, engine_factory):
         """Test that zone with minimal height waste is preferred."""
-        engine = AllocationEngine(bsf_factor=0.0)  # No BSF for simplicity
+        engine = engine_factory(0.0)  # No BSF for simplicity
         item = {**create_simple_item(height=8.0, area=10.0), 'id': 1}
         zones = [
             {**create_simple_zone(name='Tall', height=15.0, area=100.0), 'id': 1},
@@ -300,9 +204,9 @@ class TestAllocationEngineZoneSelection:
         assert result['zone_allocations'][1]['total_items'] == 1
         assert result['zone_allocations'][0]['total_items'] == 0
 
-    def test_climate_zone_priority_bonus(self):
+    def test_climate_zone_priority_bonus(self, engine_factory):
         """Test that climate items get priority bonus for climate zones."""
-        engine = AllocationEngine(bsf_factor=0.0)
+        engine = engine_factory(0.0)
         item = {**create_simple_item(requires_climate=True, area=10.0), 'id': 1}
         zones = [
             {**create_simple_zone(name='Standard', area=100.0), 'id': 1},
@@ -315,9 +219,9 @@ class TestAllocationEngineZoneSelection:
         assert result['zone_allocations'][1]['total_items'] == 1
         assert result['zone_allocations'][0]['total_items'] == 0
 
-    def test_special_handling_zone_priority_bonus(self):
+    def test_special_handling_zone_priority_bonus(self, engine_factory):
         """Test that special items get priority bonus for special handling zones."""
-        engine = AllocationEngine(bsf_factor=0.0)
+        engine = engine_factory(0.0)
         item = {**create_simple_item(requires_special=True, area=10.0), 'id': 1}
         zones = [
             {**create_simple_zone(name='Standard', area=100.0), 'id': 1},
@@ -335,28 +239,28 @@ class TestAllocationEngineZoneSelection:
 class TestAllocationEngineEdgeCases:
     """Test edge cases and boundary conditions."""
 
-    def test_empty_items_list(self, simple_zone_dict):
+    def test_empty_items_list(self, engine_factory):
         """Test allocation with no items."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        result = engine.allocate(items=[], zones=[simple_zone_dict])
+        engine = engine_factory(0.63)
+        result = engine.allocate(items=[], zones=[SIMPLE_ZONE_TEMPLATE])
 
         assert result['overall_fit'] is True
         assert len(result['failures']) == 0
         assert result['summary']['total_items'] == 0
         assert result['summary']['total_allocated'] == 0
 
-    def test_empty_zones_list(self, simple_item_dict):
+    def test_empty_zones_list(self, engine_factory):
         """Test allocation with no zones."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        result = engine.allocate(items=[simple_item_dict], zones=[])
+        engine = engine_factory(0.63)
+        result = engine.allocate(items=[SIMPLE_ITEM_TEMPLATE], zones=[])
 
         assert result['overall_fit'] is False
         assert len(result['failures']) == 1
         assert result['summary']['total_failed'] == 1
 
-    def test_bsf_factor_zero(self):
+    def test_bsf_factor_zero(self, engine_factory):
         """Test allocation with BSF=0.0 (no additional space)."""
-        engine = AllocationEngine(bsf_factor=0.0)
+        engine = engine_factory(0.0)
         item = {**create_simple_item(area=100.0), 'id': 1}
         zone = {**create_simple_zone(area=100.0), 'id': 1}
 
@@ -364,11 +268,11 @@ class TestAllocationEngineEdgeCases:
 
         # Should fit exactly with no BSF
         assert result['overall_fit'] is True
-        assert result['zone_allocations'][0]['remaining_area'] == pytest.approx(0.0)
+        assert abs(result['zone_allocations'][0]['remaining_area']) < EPS
 
-    def test_bsf_factor_one(self):
+    def test_bsf_factor_one(self, engine_factory):
         """Test allocation with BSF=1.0 (100% additional space)."""
-        engine = AllocationEngine(bsf_factor=1.0)
+        engine = engine_factory(1.0)
         item = {**create_simple_item(area=50.0), 'id': 1}
         zone = {**create_simple_zone(area=100.0), 'id': 1}
 
@@ -376,11 +280,11 @@ class TestAllocationEngineEdgeCases:
 
         # Required area = 50 * (1 + 1.0) = 100
         assert result['overall_fit'] is True
-        assert result['zone_allocations'][0]['remaining_area'] == pytest.approx(0.0)
+        assert abs(result['zone_allocations'][0]['remaining_area']) < EPS
 
-    def test_infinite_strength_zone(self):
+    def test_infinite_strength_zone(self, engine_factory):
         """Test zone with no strength limit (infinite strength)."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         # Very heavy item
         item = {**create_simple_item(psf=10000.0), 'id': 1}
         # Zone with no strength specified (defaults to inf)
@@ -393,9 +297,9 @@ class TestAllocationEngineEdgeCases:
         # Should fit despite high PSF (no strength constraint)
         assert result['overall_fit'] is True
 
-    def test_item_at_exact_height_limit(self):
+    def test_item_at_exact_height_limit(self, engine_factory):
         """Test item at exact height limit of zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         item = {**create_simple_item(height=12.0), 'id': 1}
         zone = {**create_simple_zone(height=12.0), 'id': 1}
 
@@ -403,9 +307,9 @@ class TestAllocationEngineEdgeCases:
 
         assert result['overall_fit'] is True
 
-    def test_item_at_exact_psf_limit(self):
+    def test_item_at_exact_psf_limit(self, engine_factory):
         """Test item at exact PSF limit of zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         item = {**create_simple_item(psf=300.0), 'id': 1}
         zone = {**create_simple_zone(strength=300.0), 'id': 1}
 
@@ -418,51 +322,44 @@ class TestAllocationEngineEdgeCases:
 class TestAllocationEngineFailures:
     """Test failure scenarios and failure reason reporting."""
 
-    def test_multiple_failure_reasons(self):
-        """Test item that fails multiple constraints."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        # Item that's too tall, too heavy, and too large
-        item = {**create_simple_item(height=20.0, area=1000.0, psf=500.0), 'id': 1}
+    @pytest.mark.parametrize('item_kw,reasons,can_fit', [
+        # Too tall, too large and too heavy at once
+        pytest.param(dict(height=20.0, area=1000.0, psf=500.0),
+                     ['Height too tall', 'Area too large', 'Too heavy'], False,
+                     id='multi-fail'),
+        # Only area fails, so it could fit if the zone had more space
+        pytest.param(dict(height=6.0, area=200.0, psf=100.0),
+                     ['Area too large'], True,
+                     id='area-only'),
+        # Cannot fit even in an empty zone (fundamental constraint)
+        pytest.param(dict(height=20.0),
+                     ['Height too tall'], False,
+                     id='too-tall'),
+    ])
+    def test_failure_reasons_and_fit_flag(self, engine_factory, item_kw, reasons, can_fit):
+        """Test failure reasons and the can_theoretically_fit flag."""
+        engine = engine_factory(0.63)
+        item = {**create_simple_item(**item_kw), 'id': 1}
         zone = {**create_simple_zone(height=12.0, area=100.0, strength=300.0), 'id': 1}
 
         result = engine.allocate(items=[item], zones=[zone])
 
         assert result['overall_fit'] is False
         failure = result['failures'][0]
-        # Should have all three failure reasons
-        assert 'Height too tall' in failure['failure_reason']
-        assert 'Area too large' in failure['failure_reason']
-        assert 'Too heavy' in failure['failure_reason']
-
-    def test_can_theoretically_fit_flag(self):
-        """Test can_theoretically_fit flag on failures."""
-        engine = AllocationEngine(bsf_factor=0.63)
-        # Item that only fails area constraint
-        item = {**create_simple_item(height=6.0, area=200.0, psf=100.0), 'id': 1}
-        zone = {**create_simple_zone(height=12.0, area=100.0, strength=300.0), 'id': 1}
-
-        result = engine.allocate(items=[item], zones=[zone])
-
-        failure = result['failures'][0]
-        # Could theoretically fit if zone had more area
-        assert failure['can_theoretically_fit'] is True
-
-        # Now test item that can't theoretically fit (too tall)
-        item2 = {**create_simple_item(height=20.0), 'id': 2}
-        result2 = engine.allocate(items=[item2], zones=[zone])
-
-        failure2 = result2['failures'][0]
-        # Cannot fit even in empty zone (fundamental constraint)
-        assert failure2['can_theoretically_fit'] is False
+        reported = failure['failure_reason'].split('; ')
+        assert len(reported) == len(reasons)
+        for reason, message in zip(reasons, reported):
+            assert message.startswith(reason)
+        assert failure['can_theoretically_fit'] is can_fit
 
 
 @pytest.mark.unit
 class TestAllocationEngineSummary:
     """Test summary statistics calculation."""
 
-    def test_summary_with_all_allocated(self):
+    def test_summary_with_all_allocated(self, engine_factory):
         """Test summary when all items fit."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         items = [
             {**create_simple_item(quantity=5), 'id': 1}
         ]
@@ -478,9 +375,9 @@ class TestAllocationEngineSummary:
         assert summary['overall_utilization'] > 0
         assert summary['bsf_factor'] == 0.63
 
-    def test_summary_with_partial_allocation(self):
+    def test_summary_with_partial_allocation(self, engine_factory):
         """Test summary when some items don't fit."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         items = [
             {**create_simple_item(name='Fits', height=6.0), 'id': 1},
             {**create_simple_item(name='Too Tall', height=20.0), 'id': 2}
@@ -493,11 +390,11 @@ class TestAllocationEngineSummary:
         assert summary['total_items'] == 2
         assert summary['total_allocated'] == 1
         assert summary['total_failed'] == 1
-        assert summary['allocation_rate'] == pytest.approx(50.0)
+        assert abs(summary['allocation_rate'] - 50.0) < EPS
 
-    def test_summary_zone_stats(self):
+    def test_summary_zone_stats(self, engine_factory):
         """Test zone-level statistics in summary."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         item = {**create_simple_item(), 'id': 1}
         zone = {**create_simple_zone(name='Test Zone'), 'id': 1}
 
@@ -509,26 +406,26 @@ class TestAllocationEngineSummary:
         assert zone_stats[0]['total_items'] == 1
         assert zone_stats[0]['area_utilization'] > 0
 
-    def test_utilization_calculation(self):
+    def test_utilization_calculation(self, engine_factory):
         """Test area utilization percentage calculation."""
-        engine = AllocationEngine(bsf_factor=0.0)  # No BSF for easier math
+        engine = engine_factory(0.0)  # No BSF for easier math
         item = {**create_simple_item(area=250.0), 'id': 1}
         zone = {**create_simple_zone(area=1000.0), 'id': 1}
 
         result = engine.allocate(items=[item], zones=[zone])
 
         # Used 250 out of 1000 = 25%
-        assert result['zone_allocations'][0]['area_utilization'] == pytest.approx(25.0)
-        assert result['summary']['overall_utilization'] == pytest.approx(25.0)
+        assert abs(result['zone_allocations'][0]['area_utilization'] - 25.0) < EPS
+        assert abs(result['summary']['overall_utilization'] - 25.0) < EPS
 
 
 @pytest.mark.unit
 class TestAllocationEngineItemExpansion:
     """Test item quantity expansion logic."""
 
-    def test_expand_items_with_quantities(self):
+    def test_expand_items_with_quantities(self, engine_factory):
         """Test that items are expanded by quantity."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         items = [
             {**create_simple_item(name='Item 1', quantity=3), 'id': 1},
             {**create_simple_item(name='Item 2', quantity=2), 'id': 2}
@@ -543,9 +440,9 @@ class TestAllocationEngineItemExpansion:
         # Last 2 should be Item 2
         assert sum(1 for item in expanded if item['item_id'] == 2) == 2
 
-    def test_expand_items_preserves_properties(self):
+    def test_expand_items_preserves_properties(self, engine_factory):
         """Test that expanded items preserve all properties."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         item = {
             **create_simple_item(
                 name='Test',
@@ -567,14 +464,25 @@ class TestAllocationEngineItemExpansion:
             assert expanded_item['area'] == 20.0
             assert expanded_item['requires_climate_control'] is True
 
+    @pytest.mark.parametrize('quantity', [1, 10, 1000])
+    def test_expand_items_numbers_independent_units(self, engine_factory, quantity):
+        """Test that each unit is its own dict, numbered from 1."""
+        engine = engine_factory(0.63)
+        item = {**create_simple_item(quantity=quantity), 'id': 1}
+
+        expanded = engine._expand_items([item])
+
+        assert [unit['item_number'] for unit in expanded] == list(range(1, quantity + 1))
+        assert len({id(unit) for unit in expanded}) == quantity
+
 
 @pytest.mark.unit
 class TestAllocationEngineConstraintTracking:
     """Test tracking of constrained items."""
 
-    def test_height_constrained_tracking(self):
+    def test_height_constrained_tracking(self, engine_factory):
         """Test tracking of items that are close to height limit."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         # Item within 6 inches (0.5 ft) of ceiling
         item = {**create_simple_item(height=11.6), 'id': 1}
         zone = {**create_simple_zone(height=12.0), 'id': 1}
@@ -585,9 +493,9 @@ class TestAllocationEngineConstraintTracking:
         # Should be tracked as height constrained
         assert zone_alloc['height_constrained_items'] == 1
 
-    def test_strength_constrained_tracking(self):
+    def test_strength_constrained_tracking(self, engine_factory):
         """Test tracking of items using >90% of floor strength."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         # Item at 91% of strength (300 * 0.91 = 273)
         item = {**create_simple_item(psf=273.0), 'id': 1}
         zone = {**create_simple_zone(strength=300.0), 'id': 1}
@@ -598,9 +506,9 @@ class TestAllocationEngineConstraintTracking:
         # Should be tracked as strength constrained
         assert zone_alloc['strength_constrained_items'] == 1
 
-    def test_max_equipment_psf_tracking(self):
+    def test_max_equipment_psf_tracking(self, engine_factory):
         """Test tracking of maximum PSF in zone."""
-        engine = AllocationEngine(bsf_factor=0.63)
+        engine = engine_factory(0.63)
         items = [
             {**create_simple_item(name='Light', psf=100.0), 'id': 1},
             {**create_simple_item(name='Heavy', psf=250.0), 'id': 2}
@@ -0,0 +1,89 @@
+"""Performance benchmarks for the AllocationEngine hot paths.
+
+Every test in this module carries the ``benchmark`` marker; run them with
+``pytest -m benchmark --benchmark-enable``. In regular test runs the
+benchmarks execute once, untimed, as plain correctness checks.
+"""
+import pytest
+from tests.fixtures.sample_data import create_simple_item, create_simple_zone
+
+pytestmark = pytest.mark.benchmark(group='engine')
+
+
+def _build_scenario(item_count=200, zone_count=20):
+    """Build a deterministic mixed workload of items and zones.
+
+    Returns:
+        Tuple[List[Dict], List[Dict]]: Items and zones ready for allocate()
+    """
+    items = [
+        {
+            **create_simple_item(
+                name=f'Item {idx}',
+                height=(3.0, 6.0, 8.0, 12.0)[idx % 4],
+                area=(4.0, 9.0, 16.0, 25.0)[idx % 4],
+                weight=250.0 + (idx % 7) * 100.0,
+                quantity=1 + idx % 20,
+                requires_climate=idx % 7 == 0
+            ),
+            'id': idx
+        }
+        for idx in range(1, item_count + 1)
+    ]
+    zones = [
+        {
+            **create_simple_zone(
+                name=f'Zone {idx}',
+                area=20000.0,
+                height=(10.0, 12.0, 15.0, 20.0)[idx % 4],
+                climate_controlled=idx % 4 == 0,
+                special_handling=idx % 5 == 0
+            ),
+            'id': idx
+        }
+        for idx in range(1, zone_count + 1)
+    ]
+    return items, zones
+
+
+@pytest.fixture(scope='module')
+def scenario():
+    """Return the shared benchmark workload."""
+    return _build_scenario()
+
+
+class TestAllocationEnginePerf:
+    """Benchmark allocate() and its item preparation steps."""
+
+    def test_bench_allocate(self, benchmark, engine_factory, scenario):
+        """Benchmark a full allocation run."""
+        items, zones = scenario
+        engine = engine_factory(0.63)
+
+        result = benchmark(engine.allocate, items, zones)
+
+        assert result['summary']['total_items'] == sum(item['quantity'] for item in items)
+
+    def test_bench_expand_items(self, benchmark, engine_factory, scenario):
+        """Benchmark quantity expansion."""
+        items, _ = scenario
+        engine = engine_factory(0.63)
+
+        expanded = benchmark(engine._expand_items, items)
+
+        assert len(expanded) == sum(item['quantity'] for item in items)
+
+    def test_bench_sort_items(self, benchmark, engine_factory, scenario):
+        """Benchmark item sorting on a fresh expanded list each round."""
+        items, _ = scenario
+        engine = engine_factory(0.63)
+        expanded = engine._expand_items(items)
+
+        sorted_items = benchmark.pedantic(
+            engine._sort_items,
+            setup=lambda: ((list(expanded),), {}),
+            rounds=50
+        )
+
+        heights = [item['height'] for item in sorted_items]
+        assert heights == sorted(heights, reverse=True)
@@ -1,6 +1,7 @@
 """Unit tests for database models."""
 import pytest
 from decimal import Decimal
+from sqlalchemy import insert
 from app.models.warehouse import Warehouse, Zone
 from app.models.inventory import InventoryUpload, InventoryItem
 
@@ -18,7 +19,7 @@ class TestWarehouseModel:
             is_custom=True
         )
         db.session.add(warehouse)
-        db.session.commit()
+        db.session.flush()
 
         assert warehouse.id is not None
         assert warehouse.name == 'Test Warehouse'
@@ -46,47 +47,53 @@ class TestWarehouseModel:
 
     def test_warehouse_zone_relationship(self, sample_warehouse):
         """Test relationship between warehouse and zones."""
-        zones = sample_warehouse.zones.all()
+        zones = sample_warehouse.zones
 
         assert len(zones) == 3
         for zone in zones:
             assert zone.warehouse_id == sample_warehouse.id
             assert zone.warehouse == sample_warehouse
 
-    def test_calculate_totals(self, db):
-        """Test calculate_totals() method."""
+    @pytest.mark.parametrize('zone_dims,total_area,total_volume', [
+        ([(1000, 12), (800, 15)], 1800.0, 24000.0),  # (1000 * 12) + (800 * 15)
+        ([(500, 10)], 500.0, 5000.0),
+        ([], 0.0, 0.0),
+    ], ids=['two-zones', 'one-zone', 'no-zones'])
+    def test_calculate_totals(self, db, zone_dims, total_area, total_volume):
+        """Test calculate_totals() sums zone area and volume."""
         warehouse = Warehouse(name='Test', is_custom=True)
         db.session.add(warehouse)
         db.session.flush()
 
-        # Add zones
-        zone1 = Zone(warehouse_id=warehouse.id, name='Zone 1', area=1000, height=12)
-        zone2 = Zone(warehouse_id=warehouse.id, name='Zone 2', area=800, height=15)
-        zone1.calculate_volume()
-        zone2.calculate_volume()
-        db.session.add_all([zone1, zone2])
-        db.session.commit()
+        # Add zones in a single bulk INSERT
+        zone_rows = [
+            {'warehouse_id': warehouse.id, 'name': f'Zone {idx}', 'area': area,
+             'height': height, 'volume': area * height}
+            for idx, (area, height) in enumerate(zone_dims, start=1)
+        ]
+        if zone_rows:
+            db.session.execute(insert(Zone), zone_rows)
 
         # Calculate totals
         warehouse.calculate_totals()
         db.session.commit()
 
-        assert warehouse.total_area == 1800.0  # 1000 + 800
-        assert warehouse.total_volume == 24000.0  # (1000 * 12) + (800 * 15)
+        assert warehouse.total_area == total_area
+        assert warehouse.total_volume == total_volume
 
     def test_warehouse_cascade_delete(self, db, sample_warehouse):
         """Test that deleting warehouse cascades to zones."""
         warehouse_id = sample_warehouse.id
-        zone_ids = [zone.id for zone in sample_warehouse.zones.all()]
+        zone_ids = [zone.id for zone in sample_warehouse.zones]
 
         # Delete warehouse
         db.session.delete(sample_warehouse)
         db.session.commit()
 
         # Verify zones are also deleted
-        assert db.session.query(Warehouse).filter_by(id=warehouse_id).first() is None
+        assert db.session.get(Warehouse, warehouse_id) is None
         for zone_id in zone_ids:
-            assert db.session.query(Zone).filter_by(id=zone_id).first() is None
+            assert db.session.get(Zone, zone_id) is None
 
 
 @pytest.mark.unit
@@ -104,7 +111,7 @@ class TestZoneModel:
             zone_order=1
         )
         db.session.add(zone)
-        db.session.commit()
+        db.session.flush()
 
         assert zone.id is not None
         assert zone.warehouse_id == sample_warehouse.id
@@ -114,7 +121,7 @@ class TestZoneModel:
 
     def test_zone_to_dict(self, sample_warehouse):
         """Test zone serialization to dictionary."""
-        zone = sample_warehouse.zones.first()
+        zone = sample_warehouse.zones[0]
         data = zone.to_dict()
 
         assert data['id'] == zone.id
@@ -125,19 +132,11 @@ class TestZoneModel:
         assert 'climate_controlled' in data
         assert 'special_handling' in data
 
-    def test_calculate_volume(self, db, sample_warehouse):
+    def test_calculate_volume(self):
         """Test calculate_volume() method."""
-        zone = Zone(
-            warehouse_id=sample_warehouse.id,
-            name='Test Zone',
-            area=1000.0,
-            height=12.0
-        )
-        db.session.add(zone)
+        zone = Zone(name='Test Zone', area=1000.0, height=12.0)
 
-        # Calculate volume
         zone.calculate_volume()
-        db.session.commit()
 
         assert zone.volume is not None
         assert float(zone.volume) == 12000.0  # 1000 * 12
@@ -188,7 +187,7 @@ class TestInventoryUploadModel:
             bsf_factor=0.63
         )
         db.session.add(upload)
-        db.session.commit()
+        db.session.flush()
 
         assert upload.id is not None
         assert upload.upload_name == 'Test Upload'
@@ -224,29 +223,13 @@ class TestInventoryUploadModel:
         db.session.add(upload)
         db.session.flush()
 
-        # Add items
-        item1 = InventoryItem(
-            upload_id=upload.id,
-            name='Item 1',
-            quantity=5,
-            weight=100.0,
-            area=10.0,
-            length=4.0,
-            width=2.5,
-            height=6.0
-        )
-        item2 = InventoryItem(
-            upload_id=upload.id,
-            name='Item 2',
-            quantity=3,
-            weight=200.0,
-            area=20.0,
-            length=5.0,
-            width=4.0,
-            height=8.0
-        )
-        db.session.add_all([item1, item2])
-        db.session.commit()
+        # Add items in a single bulk INSERT
+        db.session.execute(insert(InventoryItem), [
+            {'upload_id': upload.id, 'name': 'Item 1', 'quantity': 5, 'weight': 100.0,
+             'area': 10.0, 'length': 4.0, 'width': 2.5, 'height': 6.0},
+            {'upload_id': upload.id, 'name': 'Item 2', 'quantity': 3, 'weight': 200.0,
+             'area': 20.0, 'length': 5.0, 'width': 4.0, 'height': 8.0}
+        ])
 
         # Calculate totals
         upload.calculate_totals()
@@ -264,16 +247,16 @@ class TestInventoryUploadModel:
     def test_inventory_upload_cascade_delete(self, db, sample_inventory_upload):
         """Test that deleting upload cascades to items."""
         upload_id = sample_inventory_upload.id
-        item_ids = [item.id for item in sample_inventory_upload.items.all()]
+        item_ids = [item.id for item in sample_inventory_upload.items]
 
         # Delete upload
         db.session.delete(sample_inventory_upload)
         db.session.commit()
 
         # Verify items are also deleted
-        assert db.session.query(InventoryUpload).filter_by(id=upload_id).first() is None
+        assert db.session.get(InventoryUpload, upload_id) is None
         for item_id in item_ids:
-            assert db.session.query(InventoryItem).filter_by(id=item_id).first() is None
+            assert db.session.get(InventoryItem, item_id) is None
 
 
 @pytest.mark.unit
@@ -294,7 +277,7 @@ class TestInventoryItemModel:
             category='Test'
         )
         db.session.add(item)
-        db.session.commit()
+        db.session.flush()
 
         assert item.id is not None
         assert item.upload_id == sample_inventory_upload.id
@@ -303,7 +286,7 @@ class TestInventoryItemModel:
 
     def test_inventory_item_to_dict(self, sample_inventory_upload):
         """Test inventory item serialization to dictionary."""
-        item = sample_inventory_upload.items.first()
+        item = sample_inventory_upload.items[0]
         data = item.to_dict()
 
         assert data['id'] == item.id
@@ -313,80 +296,43 @@ class TestInventoryItemModel:
         assert 'requires_climate_control' in data
         assert 'requires_special_handling' in data
 
-    def test_calculate_area(self, db, sample_inventory_upload):
-        """Test calculate_area() method."""
+    @pytest.mark.parametrize('length,width,preset_area,expected', [
+        (5.0, 4.0, None, 20.0),
+        (5.0, 4.0, 25.0, 25.0),
+    ], ids=['from-dimensions', 'already-provided'])
+    def test_calculate_area(self, length, width, preset_area, expected):
+        """Test calculate_area() fills area from dimensions without overriding it."""
         item = InventoryItem(
-            upload_id=sample_inventory_upload.id,
             name='Test Item',
-            length=5.0,
-            width=4.0,
+            length=length,
+            width=width,
+            area=preset_area,
             quantity=1
         )
-        db.session.add(item)
 
-        # Calculate area
         item.calculate_area()
-        db.session.commit()
 
-        assert item.area is not None
-        assert float(item.area) == 20.0  # 5 * 4
+        assert float(item.area) == expected
 
-    def test_calculate_area_already_provided(self, db, sample_inventory_upload):
-        """Test that calculate_area() doesn't override existing area."""
-        item = InventoryItem(
-            upload_id=sample_inventory_upload.id,
-            name='Test Item',
-            length=5.0,
-            width=4.0,
-            area=25.0,  # Already set
-            quantity=1
-        )
-        db.session.add(item)
-
-        # Calculate area (should not change)
-        item.calculate_area()
-        db.session.commit()
-
-        assert float(item.area) == 25.0  # Should remain unchanged
-
-    def test_calculate_psf(self, db, sample_inventory_upload):
+    @pytest.mark.parametrize('weight,area,expected', [
+        (1000.0, 16.0, 62.5),  # 1000 / 16
+        (1000.0, 0.0, None),  # Not set when area is zero
+    ], ids=['weight-over-area', 'zero-area'])
+    def test_calculate_psf(self, weight, area, expected):
         """Test calculate_psf() method."""
         item = InventoryItem(
-            upload_id=sample_inventory_upload.id,
-            name='Test Item',
-            weight=1000.0,
-            area=16.0,
-            length=4.0,
-            width=4.0,
-            height=6.0,
-            quantity=1
-        )
-        db.session.add(item)
-
-        # Calculate PSF
-        item.calculate_psf()
-        db.session.commit()
-
-        assert item.psf is not None
-        assert float(item.psf) == pytest.approx(62.5)  # 1000 / 16
-
-    def test_calculate_psf_zero_area(self, db, sample_inventory_upload):
-        """Test that calculate_psf() handles zero area gracefully."""
-        item = InventoryItem(
-            upload_id=sample_inventory_upload.id,
             name='Test Item',
-            weight=1000.0,
-            area=0.0,
+            weight=weight,
+            area=area,
             quantity=1
         )
-        db.session.add(item)
 
-        # Calculate PSF (should not crash)
         item.calculate_psf()
-        db.session.commit()
 
-        # PSF should not be set when area is zero
-        assert item.psf is None or float(item.psf) == 0
+        if expected is None:
+            assert item.psf is None
+        else:
+            assert float(item.psf) == expected
 
     def test_item_with_requirements(self, db, sample_inventory_upload):
         """Test item with climate control and special handling requirements."""
@@ -435,43 +381,26 @@ class TestInventoryItemModel:
         db.session.add(item)
         db.session.commit()
 
-        assert float(item.weight) == pytest.approx(123.45)
-        assert float(item.length) == pytest.approx(12.34)
-        assert float(item.width) == pytest.approx(56.78)
-        assert float(item.height) == pytest.approx(9.12)
-        assert float(item.area) == pytest.approx(700.85)
+        assert item.weight == Decimal('123.45')
+        assert item.length == Decimal('12.34')
+        assert item.width == Decimal('56.78')
+        assert item.height == Decimal('9.12')
+        assert item.area == Decimal('700.85')
 
 
 @pytest.mark.unit
 class TestModelRelationships:
     """Test relationships between models."""
 
-    def test_warehouse_to_zones_relationship(self, sample_warehouse):
-        """Test accessing zones from warehouse."""
-        zones = sample_warehouse.zones.all()
-
-        assert len(zones) > 0
-        for zone in zones:
-            assert zone.warehouse == sample_warehouse
-
-    def test_zone_to_warehouse_relationship(self, sample_warehouse):
-        """Test accessing warehouse from zone."""
-        zone = sample_warehouse.zones.first()
-
-        assert zone.warehouse is not None
-        assert zone.warehouse.id == sample_warehouse.id
-
-    def test_upload_to_items_relationship(self, sample_inventory_upload):
-        """Test accessing items from upload."""
-        items = sample_inventory_upload.items.all()
-
-        assert len(items) > 0
-        for item in items:
-            assert item.upload == sample_inventory_upload
-
-    def test_item_to_upload_relationship(self, sample_inventory_upload):
-        """Test accessing upload from item."""
-        item = sample_inventory_upload.items.first()
-
-        assert item.upload is not None
-        assert item.upload.id == sample_inventory_upload.id
+    @pytest.mark.parametrize('parent_fixture,children_attr,parent_attr', [
+        ('sample_warehouse', 'zones', 'warehouse'),
+        ('sample_inventory_upload', 'items', 'upload'),
+    ], ids=['warehouse-zones', 'upload-items'])
+    def test_relationship_round_trip(self, request, parent_fixture, children_attr, parent_attr):
+        """Test that each child reached from its parent points back to that parent."""
+        parent = request.getfixturevalue(parent_fixture)
+        children = getattr(parent, children_attr)
+
+        assert len(children) > 0
+        for child in children:
+            assert getattr(child, parent_attr) is parent
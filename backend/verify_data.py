@@ -1,19 +1,33 @@
 """Quick script to verify seed data."""
 from app import create_app
-from app.models import Warehouse, InventoryUpload, AllocationResult
+from app.extensions import db
+from app.models import Warehouse, Zone, InventoryUpload, AllocationResult
 
 app = create_app()
 
 with app.app_context():
+    # All three table counts in one round-trip
+    warehouse_count, upload_count, result_count = db.session.query(
+        db.select(db.func.count(Warehouse.id)).scalar_subquery(),
+        db.select(db.func.count(InventoryUpload.id)).scalar_subquery(),
+        db.select(db.func.count(AllocationResult.id)).scalar_subquery()
+    ).one()
+
     print("Database Contents:")
-    print(f"  Warehouses: {Warehouse.query.count()}")
-    print(f"  Inventory Uploads: {InventoryUpload.query.count()}")
-    print(f"  Allocation Results: {AllocationResult.query.count()}")
+    print(f"  Warehouses: {warehouse_count}")
+    print(f"  Inventory Uploads: {upload_count}")
+    print(f"  Allocation Results: {result_count}")
 
     print("\nWarehouse Details:")
-    for w in Warehouse.query.all():
-        print(f"  - {w.name}: {w.zones.count()} zones")
+    warehouse_rows = db.session.query(
+        Warehouse.name, db.func.count(Zone.id)
+    ).outerjoin(Zone).group_by(Warehouse.id).order_by(Warehouse.id)
+    for name, zone_count in warehouse_rows:
+        print(f"  - {name}: {zone_count} zones")
 
     print("\nInventory Upload Details:")
-    for u in InventoryUpload.query.all():
-        print(f"  - {u.upload_name}: {u.total_items} items")
+    upload_rows = db.session.query(
+        InventoryUpload.upload_name, InventoryUpload.total_items
+    ).order_by(InventoryUpload.id)
+    for upload_name, total_items in upload_rows:
+        print(f"  - {upload_name}: {total_items} items")